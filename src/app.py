@@ -1,6 +1,6 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, status
+from fastapi import FastAPI, HTTPException, Query, status
 
 import main
 from schemas import *
@@ -188,14 +188,43 @@ def update_rx(name: str, update_data: DeviceUpdate):
         )
 
 
+@app.put("/arrays/{ant_type}", response_model=AntennaArrayResponse, tags=["Arrays"])
+def set_array(ant_type: str, config: AntennaArrayUpdate):
+    """Configure the antenna array used by all transmitters ('tx') or receivers ('rx')"""
+    try:
+        result = main.set_array(
+            ant_type,
+            (config.num_rows, config.num_cols),
+            (config.vertical_spacing, config.horizontal_spacing),
+            config.pattern,
+            config.polarization,
+        )
+        return AntennaArrayResponse(**result)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid antenna array configuration: {str(e)}",
+        )
+    except RuntimeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to configure antenna array: {str(e)}",
+        )
+
+
 @app.post(
     "/simulation/paths", response_model=PathComputationResponse, tags=["Simulation"]
 )
 def compute_paths(params: PathComputationRequest):
     try:
-        result = main.compute_paths(params.max_depth)
+        result = main.compute_paths(params.max_depth, params.synthetic_array)
         return PathComputationResponse(
-            path_count=result["path_count"], max_depth=result["max_depth"]
+            path_count=result["path_count"],
+            max_depth=result["max_depth"],
+            synthetic_array=result["synthetic_array"],
+            computation_time=result["computation_time"],
+            synthetic_speedup=result["synthetic_speedup"],
+            cir_shape=CirShape(**result["cir_shape"]),
         )
     except ValueError as e:
         raise HTTPException(
@@ -225,3 +254,33 @@ def get_cir():
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve CIR: {str(e)}",
         )
+
+
+@app.get(
+    "/simulation/stats", response_model=ChannelStatisticsResponse, tags=["Simulation"]
+)
+def get_stats(
+    tx_power_dbm: float = Query(0.0, description="Transmit power (dBm) used for RSS")
+):
+    """Retrieve per-link channel statistics computed from the CIR"""
+    try:
+        result = main.get_channel_statistics(tx_power_dbm)
+        return ChannelStatisticsResponse(
+            tx_power_dbm=result["tx_power_dbm"],
+            links=[LinkStatistics(**link) for link in result["links"]],
+        )
+    except RuntimeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to compute channel statistics: {str(e)}",
+        )
+
+
+@app.get(
+    "/simulation/coalescing",
+    response_model=CoalescingStatsResponse,
+    tags=["Simulation"],
+)
+def get_coalescing_stats():
+    """Retrieve counters of coalesced concurrent simulation requests"""
+    return CoalescingStatsResponse(**main.get_coalescing_stats())
@@ -0,0 +1,396 @@
+"""
+Headless batch runner.
+
+Drives the simulation engine directly from a declarative scenario file,
+bypassing the REST API, and streams per-step CIR arrays to chunked output
+files. Usage:
+
+    python batch.py scenario.json -o results/ --format npz --chunk-size 100
+    python batch.py scenario.json -o results/ --resume
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+import main
+from schemas import ScenarioConfig
+
+MANIFEST_NAME = "manifest.json"
+
+
+class ChunkWriter(ABC):
+    """Base class for writers persisting one chunk of steps per file."""
+
+    extension = ""
+
+    def __init__(self, output_dir: str):
+        self.output_dir = output_dir
+
+    def chunk_path(self, chunk_index: int) -> str:
+        return os.path.join(self.output_dir, f"chunk_{chunk_index:05d}{self.extension}")
+
+    def write(self, chunk_index: int, arrays: Dict[str, np.ndarray]) -> str:
+        """Write a chunk atomically and return its file name."""
+        path = self.chunk_path(chunk_index)
+        tmp_path = path + ".tmp"
+        self._write(tmp_path, arrays)
+        os.replace(tmp_path, path)
+        return os.path.basename(path)
+
+    @abstractmethod
+    def _write(self, path: str, arrays: Dict[str, np.ndarray]) -> None:
+        """Write the chunk arrays to path."""
+
+
+class NpzChunkWriter(ChunkWriter):
+    extension = ".npz"
+
+    def _write(self, path: str, arrays: Dict[str, np.ndarray]) -> None:
+        # np.savez appends ".npz" to names without it, so hand it a file object
+        with open(path, "wb") as f:
+            np.savez(f, **arrays)
+
+
+class ParquetChunkWriter(ChunkWriter):
+    """One row per step; multi-dimensional arrays are flattened per row."""
+
+    extension = ".parquet"
+
+    def __init__(self, output_dir: str):
+        super().__init__(output_dir)
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise RuntimeError("Parquet output requires pyarrow: pip install pyarrow")
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+
+    def _column(self, values: np.ndarray):
+        if values.ndim == 1:
+            return self._pa.array(values)
+        row_size = int(np.prod(values.shape[1:]))
+        flat = self._pa.array(np.ascontiguousarray(values).reshape(-1))
+        return self._pa.FixedSizeListArray.from_arrays(flat, row_size)
+
+    def _write(self, path: str, arrays: Dict[str, np.ndarray]) -> None:
+        columns = {}
+        metadata = {}
+        for key, values in arrays.items():
+            if key == "devices":
+                metadata[key] = json.dumps(values.tolist())
+                continue
+            if np.iscomplexobj(values):
+                columns[f"{key}_real"] = self._column(values.real)
+                columns[f"{key}_imag"] = self._column(values.imag)
+            else:
+                columns[key] = self._column(values)
+            metadata[f"{key}_shape"] = json.dumps(list(values.shape[1:]))
+        table = self._pa.table(columns).replace_schema_metadata(metadata)
+        self._pq.write_table(table, path)
+
+
+class Hdf5ChunkWriter(ChunkWriter):
+    extension = ".h5"
+
+    def __init__(self, output_dir: str):
+        super().__init__(output_dir)
+        try:
+            import h5py
+        except ImportError:
+            raise RuntimeError("HDF5 output requires h5py: pip install h5py")
+        self._h5py = h5py
+
+    def _write(self, path: str, arrays: Dict[str, np.ndarray]) -> None:
+        with self._h5py.File(path, "w") as f:
+            for key, values in arrays.items():
+                if values.dtype.kind == "U":
+                    f.create_dataset(key, data=values.astype("S"))
+                else:
+                    f.create_dataset(key, data=values)
+
+
+WRITERS = {
+    "npz": NpzChunkWriter,
+    "parquet": ParquetChunkWriter,
+    "hdf5": Hdf5ChunkWriter,
+}
+
+
+def load_scenario(path: str) -> Tuple[ScenarioConfig, str]:
+    """Load and validate a scenario file, returning it with its digest."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    scenario = ScenarioConfig.model_validate_json(raw)
+
+    device_names = {d.name for d in scenario.transmitters + scenario.receivers}
+    for name, trajectory in scenario.trajectories.items():
+        if name not in device_names:
+            raise ValueError(f"Trajectory references unknown device '{name}'")
+        if not trajectory.waypoints and trajectory.velocity is None:
+            raise ValueError(f"Trajectory for '{name}' needs waypoints or velocity")
+        if trajectory.waypoints and trajectory.velocity is not None:
+            raise ValueError(
+                f"Trajectory for '{name}' cannot have both waypoints and velocity"
+            )
+        if not trajectory.waypoints and scenario.num_steps is None:
+            raise ValueError(
+                f"Trajectory for '{name}' uses a velocity, so num_steps is required"
+            )
+
+    return scenario, hashlib.sha256(raw).hexdigest()
+
+
+def get_num_steps(scenario: ScenarioConfig) -> int:
+    if scenario.num_steps is not None:
+        return scenario.num_steps
+    lengths = [len(t.waypoints) for t in scenario.trajectories.values()]
+    return max(lengths, default=0) or 1
+
+
+def build_positions(scenario: ScenarioConfig, num_steps: int) -> Tuple[List[str], np.ndarray]:
+    """
+    Precompute the position of every device at every step.
+
+    Returns:
+        Device names (transmitters first) and an array of shape
+        [num_steps, num_devices, 3]
+    """
+    devices = scenario.transmitters + scenario.receivers
+    names = [d.name for d in devices]
+    positions = np.empty((num_steps, len(devices), 3), dtype=np.float64)
+    steps = np.arange(num_steps)
+
+    for i, device in enumerate(devices):
+        start = np.array(device.position.to_tuple())
+        trajectory = scenario.trajectories.get(device.name)
+        if trajectory is None:
+            positions[:, i] = start
+        elif trajectory.waypoints:
+            waypoints = np.array([w.to_tuple() for w in trajectory.waypoints])
+            positions[:, i] = waypoints[np.minimum(steps, len(waypoints) - 1)]
+        else:
+            velocity = np.array(trajectory.velocity.to_tuple())
+            positions[:, i] = start + steps[:, None] * velocity
+
+    return names, positions
+
+
+def setup_scene(scenario: ScenarioConfig) -> None:
+    """Load the scene, configure arrays and place all devices."""
+    main.initialize(scenario.scene)
+
+    # Arrays must be set before devices are added, otherwise the defaults apply
+    for array in scenario.arrays:
+        main.set_array(
+            array.antenna_type,
+            (array.num_rows, array.num_cols),
+            (array.vertical_spacing, array.horizontal_spacing),
+            array.pattern,
+            array.polarization,
+        )
+
+    for tx in scenario.transmitters:
+        main.add_transmitter(
+            tx.name,
+            tx.position.to_tuple(),
+            tx.orientation.to_tuple() if tx.orientation else None,
+        )
+    for rx in scenario.receivers:
+        main.add_receiver(
+            rx.name,
+            rx.position.to_tuple(),
+            rx.orientation.to_tuple() if rx.orientation else None,
+        )
+
+
+def stack_steps(records: List[Tuple[np.ndarray, np.ndarray]]) -> Dict[str, np.ndarray]:
+    """
+    Stack per-step (a, tau) arrays into chunk arrays.
+
+    The number of paths varies between steps, so the path axis is zero-padded
+    to the largest count in the chunk and the true count is kept in
+    'num_paths'. Padded delays are set to -1.
+    """
+    num_paths = np.array([tau.shape[-1] for _, tau in records], dtype=np.int32)
+    max_paths = int(num_paths.max())
+
+    def pad(array: np.ndarray, axis: int, value: float) -> np.ndarray:
+        missing = max_paths - array.shape[axis]
+        if missing == 0:
+            return array
+        widths = [(0, 0)] * array.ndim
+        widths[axis] = (0, missing)
+        return np.pad(array, widths, constant_values=value)
+
+    return {
+        "a": np.stack([pad(a, -2, 0) for a, _ in records]).astype(np.complex64),
+        "tau": np.stack([pad(tau, -1, -1) for _, tau in records]).astype(np.float32),
+        "num_paths": num_paths,
+    }
+
+
+def read_manifest(output_dir: str) -> Optional[Dict]:
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_manifest(output_dir: str, manifest: Dict) -> None:
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    with open(path + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+
+def run(
+    scenario_path: str,
+    output_dir: str,
+    output_format: str = "npz",
+    chunk_size: int = 100,
+    resume: bool = False,
+) -> Dict:
+    """
+    Run a scenario and write its per-step CIRs to chunked files.
+
+    Args:
+        scenario_path: Path to the JSON scenario file
+        output_dir: Directory receiving the chunk files and manifest
+        output_format: 'npz', 'parquet' or 'hdf5'
+        chunk_size: Number of steps per output file
+        resume: Continue an interrupted run found in output_dir
+
+    Returns:
+        The final manifest
+    """
+    if output_format not in WRITERS:
+        raise ValueError(
+            f"Invalid format: {output_format}. Must be one of {', '.join(WRITERS)}"
+        )
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1")
+
+    scenario, digest = load_scenario(scenario_path)
+    num_steps = get_num_steps(scenario)
+    names, positions = build_positions(scenario, num_steps)
+    tx_names = {tx.name for tx in scenario.transmitters}
+    moving = [(i, name) for i, name in enumerate(names) if name in scenario.trajectories]
+
+    os.makedirs(output_dir, exist_ok=True)
+    writer = WRITERS[output_format](output_dir)
+
+    manifest = read_manifest(output_dir)
+    if manifest is not None and not resume:
+        raise RuntimeError(
+            f"Output directory '{output_dir}' already holds a run; use --resume"
+        )
+    if manifest is not None:
+        for key, expected in (
+            ("engine", main.engine_name),
+            ("scenario_digest", digest),
+            ("format", output_format),
+            ("chunk_size", chunk_size),
+        ):
+            if manifest.get(key) != expected:
+                raise RuntimeError(f"Cannot resume: {key} differs from previous run")
+    else:
+        manifest = {
+            "scenario": os.path.abspath(scenario_path),
+            "scenario_digest": digest,
+            "engine": main.engine_name,
+            "format": output_format,
+            "chunk_size": chunk_size,
+            "num_steps": num_steps,
+            "devices": names,
+            "completed_steps": 0,
+            "chunks": [],
+        }
+
+    start_step = manifest["completed_steps"]
+    if start_step >= num_steps:
+        print(f"All {num_steps} steps already completed")
+        return manifest
+
+    # Reset the engine even if the sweep is interrupted, so it can be resumed cleanly
+    try:
+        setup_scene(scenario)
+        print(
+            f"Running steps {start_step}-{num_steps - 1} ({len(moving)} moving devices)"
+        )
+
+        run_start = time.perf_counter()
+        for chunk_start in range(start_step, num_steps, chunk_size):
+            chunk_end = min(chunk_start + chunk_size, num_steps)
+            chunk_timer = time.perf_counter()
+            records = []
+
+            for step in range(chunk_start, chunk_end):
+                for i, name in moving:
+                    position = tuple(positions[step, i])
+                    if name in tx_names:
+                        main.update_transmitter_position(name, position)
+                    else:
+                        main.update_receiver_position(name, position)
+                main.compute_paths(
+                    scenario.solver.max_depth, scenario.solver.synthetic_array
+                )
+                records.append(main.get_cir_arrays())
+
+            arrays = stack_steps(records)
+            arrays["step"] = np.arange(chunk_start, chunk_end, dtype=np.int64)
+            arrays["positions"] = positions[chunk_start:chunk_end]
+            arrays["devices"] = np.array(names)
+
+            chunk_name = writer.write(chunk_start // chunk_size, arrays)
+            manifest["chunks"].append(chunk_name)
+            manifest["completed_steps"] = chunk_end
+            write_manifest(output_dir, manifest)
+
+            elapsed = time.perf_counter() - chunk_timer
+            print(
+                f"{chunk_name}: steps {chunk_start}-{chunk_end - 1}, "
+                f"{(chunk_end - chunk_start) / elapsed:.2f} steps/s"
+            )
+
+        total = time.perf_counter() - run_start
+        print(
+            f"Completed {num_steps - start_step} steps in {total:.1f}s "
+            f"({(num_steps - start_step) / total:.2f} steps/s)"
+        )
+    finally:
+        main.shutdown()
+    return manifest
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Run a Sionna scenario headlessly and write per-step CIRs"
+    )
+    parser.add_argument("scenario", help="Path to the JSON scenario file")
+    parser.add_argument(
+        "-o", "--output", required=True, help="Output directory for chunks"
+    )
+    parser.add_argument(
+        "-f", "--format", choices=sorted(WRITERS), default="npz", help="Output format"
+    )
+    parser.add_argument(
+        "-c", "--chunk-size", type=int, default=100, help="Steps per output file"
+    )
+    parser.add_argument(
+        "--resume", action="store_true", help="Resume an interrupted run"
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    run(args.scenario, args.output, args.format, args.chunk_size, args.resume)
@@ -0,0 +1,222 @@
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from simulation_engine import SimulationEngine
+from utils import AntennaType, PolarizationType
+
+SPEED_OF_LIGHT = 299792458.0
+
+
+class FakeEngine(SimulationEngine):
+    """
+    Deterministic stand-in for the Sionna engine.
+
+    Returns CIR arrays of configurable shape without any ray tracing, so the
+    API layer can be exercised and measured without sionna, mitsuba or a GPU.
+    Path gains follow free-space loss over the device distance with an
+    exponentially decaying delay profile; the first path is line-of-sight.
+    """
+
+    def __init__(
+        self,
+        num_paths: int = 16,
+        num_time_steps: int = 1,
+        num_objects: int = 10,
+        delay_spread: float = 1e-7,
+        compute_delay: float = 0.0,
+        seed: int = 0,
+    ):
+        """
+        Args:
+            num_paths: Number of paths per link
+            num_time_steps: Number of CIR time steps
+            num_objects: Number of objects reported by the fake scene
+            delay_spread: Mean excess delay of the exponential profile (seconds)
+            compute_delay: Artificial solver time per compute_paths call (seconds)
+            seed: Seed for the random path phases and delays
+        """
+        super().__init__()
+        self.num_paths = num_paths
+        self.num_time_steps = num_time_steps
+        self.num_objects = num_objects
+        self.delay_spread = delay_spread
+        self.compute_delay = compute_delay
+        self.seed = seed
+        self._num_ant = {AntennaType.Transmitter: 1, AntennaType.Receiver: 1}
+        self._cir: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._link_names: Optional[Tuple[List[str], List[str]]] = None
+        self._angles: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def load_simulation_scene(self, scene_path: Optional[str] = None) -> None:
+        self.scene = scene_path or "fake"
+        self._bump_state()
+
+    def get_scene_info(self) -> Dict:
+        if not self.scene:
+            raise RuntimeError("No scene loaded")
+        return {
+            "object_count": self.num_objects,
+            "objects": [f"object_{i}" for i in range(self.num_objects)],
+            "transmitter_count": len(self.transmitters),
+            "receiver_count": len(self.receivers),
+        }
+
+    def add_transmitter(
+        self,
+        name: str,
+        position: Tuple[float, float, float],
+        orientation: Optional[Tuple[float, float, float]] = None,
+    ) -> None:
+        if not self.scene:
+            raise RuntimeError("Scene not loaded")
+        self.transmitters[name] = np.array(position, dtype=np.float64)
+        self._bump_state()
+
+    def add_receiver(
+        self,
+        name: str,
+        position: Tuple[float, float, float],
+        orientation: Optional[Tuple[float, float, float]] = None,
+    ) -> None:
+        if not self.scene:
+            raise RuntimeError("Scene not loaded")
+        self.receivers[name] = np.array(position, dtype=np.float64)
+        self._bump_state()
+
+    def set_array(
+        self,
+        ant_type: AntennaType,
+        num_rows: int = 1,
+        num_cols: int = 1,
+        vertical_spacing: float = 1.0,
+        horizontal_spacing: float = 1.0,
+        pattern: str = "tr38901",
+        polarization: str = "V",
+    ) -> None:
+        if not self.scene:
+            raise RuntimeError("Scene not loaded")
+        num_pol = 2 if polarization == PolarizationType.CROSS.value else 1
+        self._num_ant[ant_type] = num_rows * num_cols * num_pol
+        self._bump_state()
+
+    def get_num_antennas(self) -> Tuple[int, int]:
+        if not self.scene:
+            raise RuntimeError("Scene not loaded")
+        return self._num_ant[AntennaType.Transmitter], self._num_ant[AntennaType.Receiver]
+
+    def update_ant_position(
+        self, ant_type: AntennaType, name: str, position: Tuple[float, float, float]
+    ) -> None:
+        if ant_type == AntennaType.Transmitter:
+            if name not in self.transmitters:
+                raise ValueError(f"Transmitter '{name}' not found")
+            self.transmitters[name] = np.array(position, dtype=np.float64)
+        elif ant_type == AntennaType.Receiver:
+            if name not in self.receivers:
+                raise ValueError(f"Receiver '{name}' not found")
+            self.receivers[name] = np.array(position, dtype=np.float64)
+        else:
+            raise RuntimeError("Invalid Antenna Type")
+        self._bump_state()
+
+    def compute_paths(self, max_depth: int = 3, synthetic_array: bool = True) -> Dict:
+        if not self.scene:
+            raise RuntimeError("Scene not loaded")
+
+        if not self.transmitters or not self.receivers:
+            raise RuntimeError("No transmitters or receivers in scene")
+
+        start = time.perf_counter()
+        if self.compute_delay:
+            time.sleep(self.compute_delay)
+        self._cir, self._angles = self._synthesize_cir()
+        self._link_names = (list(self.receivers), list(self.transmitters))
+        computation_time = time.perf_counter() - start
+        self._bump_state()
+
+        a = self._cir[0]
+        return {
+            "path_count": int(a.shape[0] * a.shape[2] * a.shape[4]),
+            "max_depth": max_depth,
+            "synthetic_array": synthetic_array,
+            "computation_time": computation_time,
+            "synthetic_speedup": self._record_solver_time(
+                max_depth, synthetic_array, computation_time
+            ),
+            "cir_shape": {
+                "num_rx": int(a.shape[0]),
+                "num_rx_ant": int(a.shape[1]),
+                "num_tx": int(a.shape[2]),
+                "num_tx_ant": int(a.shape[3]),
+                "num_paths": int(a.shape[4]),
+                "num_time_steps": int(a.shape[5]),
+            },
+        }
+
+    def _synthesize_cir(
+        self,
+    ) -> Tuple[Tuple[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]:
+        rng = np.random.default_rng(self.seed)
+        num_tx_ant, num_rx_ant = self.get_num_antennas()
+        rx_pos = np.stack(list(self.receivers.values()))
+        tx_pos = np.stack(list(self.transmitters.values()))
+        num_rx, num_tx = len(rx_pos), len(tx_pos)
+
+        # LOS delay and free-space amplitude per link [num_rx, num_tx]
+        distance = np.linalg.norm(rx_pos[:, None] - tx_pos[None], axis=-1)
+        distance = np.maximum(distance, 1.0)
+        los_amplitude = SPEED_OF_LIGHT / (4 * np.pi * distance * 3.5e9)
+
+        # Excess delays (first path at zero) and exponential power decay per path
+        excess = np.sort(rng.exponential(self.delay_spread, self.num_paths))
+        excess -= excess[0]
+        decay = np.exp(-excess / (2 * self.delay_spread))
+
+        shape = (num_rx, num_rx_ant, num_tx, num_tx_ant, self.num_paths)
+        amplitude = los_amplitude[:, None, :, None, None] * decay
+        phase = rng.uniform(-np.pi, np.pi, shape + (self.num_time_steps,))
+        a = (amplitude[..., None] * np.exp(1j * phase)).astype(np.complex64)
+
+        # Delays are normalized to the first path, as in Sionna.cir()
+        tau = np.broadcast_to(excess, shape).astype(np.float32)
+
+        # The LOS path leaves/arrives along the tx-rx line, the others at random azimuths
+        offset = rx_pos[:, None] - tx_pos[None]
+        los_phi_t = np.arctan2(offset[..., 1], offset[..., 0])
+        angle_shape = (num_rx, num_tx, self.num_paths)
+        phi_t = rng.uniform(-np.pi, np.pi, angle_shape)
+        phi_r = rng.uniform(-np.pi, np.pi, angle_shape)
+        phi_t[..., 0] = los_phi_t
+        phi_r[..., 0] = np.arctan2(-offset[..., 1], -offset[..., 0])
+        return (a, tau), (phi_t.astype(np.float32), phi_r.astype(np.float32))
+
+    def get_cir_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._cir is None:
+            raise RuntimeError("No paths computed")
+        return self._cir
+
+    def get_link_names(self) -> Tuple[List[str], List[str]]:
+        if self._link_names is None:
+            raise RuntimeError("No paths computed")
+        return self._link_names
+
+    def get_path_angles(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._angles is None:
+            raise RuntimeError("No paths computed")
+        return self._angles
+
+    def get_los_mask(self) -> np.ndarray:
+        if self._cir is None:
+            raise RuntimeError("No paths computed")
+        a = self._cir[0]
+        return np.ones((a.shape[0], a.shape[2]), dtype=bool)
+
+    def reset(self) -> None:
+        self.transmitters.clear()
+        self.receivers.clear()
+        self._cir = None
+        self._link_names = None
+        self._angles = None
+        self._bump_state()
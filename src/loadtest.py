@@ -0,0 +1,312 @@
+"""
+API load generator.
+
+Drives the routes of app.py at a configurable concurrency and reports
+p50/p99 latency and requests per second per route. Adding devices re-adds
+the existing tx/rx names, replacing them. POST /scene/reset only runs during
+the unmeasured setup, since resetting mid-run would remove the devices the
+other workers are using.
+
+With --start-server the API is served in-process on the fake engine, so the
+FastAPI, pydantic and serialization overhead can be measured without sionna
+or a GPU:
+
+    python loadtest.py --start-server --concurrency 8 --requests 2000
+    python loadtest.py --url http://127.0.0.1:8000 --routes cir stats
+"""
+
+import argparse
+import http.client
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import numpy as np
+
+# name -> (method, path, body) built from the request index
+Route = Callable[[int, "LoadTest"], Tuple[str, str, Optional[Dict]]]
+
+
+def _position(i: int, z: float) -> Dict:
+    return {"x": float(i % 100), "y": float((i // 100) % 100), "z": z}
+
+
+ROUTES: Dict[str, Route] = {
+    "root": lambda i, t: ("GET", "/", None),
+    "scene": lambda i, t: ("GET", "/scene", None),
+    "list_tx": lambda i, t: ("GET", "/transmitters", None),
+    "list_rx": lambda i, t: ("GET", "/receivers", None),
+    "add_tx": lambda i, t: (
+        "POST",
+        "/transmitters",
+        {"name": f"tx{i % t.num_tx}", "position": _position(i, 30.0)},
+    ),
+    "add_rx": lambda i, t: (
+        "POST",
+        "/receivers",
+        {"name": f"rx{i % t.num_rx}", "position": _position(i, 1.5)},
+    ),
+    "update_tx": lambda i, t: (
+        "PUT",
+        f"/transmitters/tx{i % t.num_tx}",
+        {"position": _position(i, 30.0)},
+    ),
+    "update_rx": lambda i, t: (
+        "PUT",
+        f"/receivers/rx{i % t.num_rx}",
+        {"position": _position(i, 1.5)},
+    ),
+    "array": lambda i, t: ("PUT", "/arrays/rx", {"num_rows": 1, "num_cols": 1}),
+    "paths": lambda i, t: ("POST", "/simulation/paths", {"max_depth": 3}),
+    "cir": lambda i, t: ("GET", "/simulation/cir", None),
+    "stats": lambda i, t: ("GET", "/simulation/stats?tx_power_dbm=30", None),
+    "coalescing": lambda i, t: ("GET", "/simulation/coalescing", None),
+}
+
+
+class LoadTest:
+    def __init__(self, url: str, num_tx: int = 1, num_rx: int = 4):
+        parsed = urlparse(url)
+        self.host = parsed.hostname
+        self.port = parsed.port or 80
+        self.num_tx = num_tx
+        self.num_rx = num_rx
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+
+    def request(
+        self, name: str, method: str, path: str, body: Optional[Dict] = None
+    ) -> int:
+        """Send one request on this thread's keep-alive connection and record it."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = http.client.HTTPConnection(self.host, self.port)
+
+        payload = json.dumps(body) if body is not None else None
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        start = time.perf_counter()
+        try:
+            conn.request(method, path, body=payload, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            self._local.conn = None
+            status = 0
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self.latencies.setdefault(name, []).append(elapsed)
+            if not 200 <= status < 300:
+                self.errors[name] = self.errors.get(name, 0) + 1
+        return status
+
+    def setup(self) -> None:
+        """
+        Reset the scene, place devices, configure arrays and trace once.
+
+        Setup requests are not included in the reported results.
+        """
+
+        def setup_request(method: str, path: str, body: Optional[Dict] = None):
+            status = self.request("setup", method, path, body)
+            if not 200 <= status < 300:
+                raise RuntimeError(f"Setup failed: {method} {path} returned {status}")
+
+        setup_request("POST", "/scene/reset")
+        for i in range(self.num_tx):
+            device = {"name": f"tx{i}", "position": _position(i, 30.0)}
+            setup_request("POST", "/transmitters", device)
+        for i in range(self.num_rx):
+            device = {"name": f"rx{i}", "position": _position(i, 1.5)}
+            setup_request("POST", "/receivers", device)
+        setup_request("PUT", "/arrays/tx", {"num_rows": 1, "num_cols": 1})
+        setup_request("POST", "/simulation/paths", {"max_depth": 3})
+
+        self.latencies.clear()
+        self.errors.clear()
+
+    def run(
+        self,
+        routes: List[str],
+        concurrency: int,
+        num_requests: Optional[int] = None,
+        duration: Optional[float] = None,
+    ) -> float:
+        """
+        Cycle through the routes from concurrent workers.
+
+        Stops after num_requests requests or duration seconds, whichever is
+        given. Returns the elapsed wall time. An exception in any worker stops
+        all workers and is re-raised.
+        """
+        counter = iter(range(sys.maxsize))
+        counter_lock = threading.Lock()
+        stop = threading.Event()
+        deadline = time.perf_counter() + duration if duration else None
+
+        def worker() -> None:
+            try:
+                while not stop.is_set():
+                    with counter_lock:
+                        i = next(counter)
+                    if num_requests is not None and i >= num_requests:
+                        return
+                    if deadline is not None and time.perf_counter() >= deadline:
+                        return
+                    name = routes[i % len(routes)]
+                    method, path, body = ROUTES[name](i, self)
+                    self.request(name, method, path, body)
+            except BaseException:
+                stop.set()
+                raise
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            futures = [pool.submit(worker) for _ in range(concurrency)]
+        for future in futures:
+            future.result()
+        return time.perf_counter() - start
+
+    def report(self, elapsed: float) -> Dict[str, Dict]:
+        """Per-route count, errors, p50/p99 latency (ms) and requests per second."""
+        results = {}
+        all_latencies = []
+        for name, latencies in sorted(self.latencies.items()):
+            values = np.array(latencies) * 1000
+            all_latencies.extend(latencies)
+            results[name] = {
+                "count": len(values),
+                "errors": self.errors.get(name, 0),
+                "p50_ms": float(np.percentile(values, 50)),
+                "p99_ms": float(np.percentile(values, 99)),
+                "rps": len(values) / elapsed,
+            }
+        values = np.array(all_latencies) * 1000
+        results["total"] = {
+            "count": len(values),
+            "errors": sum(self.errors.values()),
+            "p50_ms": float(np.percentile(values, 50)),
+            "p99_ms": float(np.percentile(values, 99)),
+            "rps": len(values) / elapsed,
+        }
+        return results
+
+
+def start_server(host: str, port: int):
+    """Serve app.py in a background thread, using the fake engine by default."""
+    os.environ.setdefault("SIMULATION_ENGINE", "fake")
+    import uvicorn
+
+    from app import app
+
+    server = uvicorn.Server(
+        uvicorn.Config(app, host=host, port=port, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        if not thread.is_alive():
+            raise RuntimeError("Server failed to start")
+        time.sleep(0.05)
+    return server, thread
+
+
+def print_report(results: Dict[str, Dict]) -> None:
+    print(f"{'route':<12} {'count':>8} {'errors':>7} {'p50 ms':>9} {'p99 ms':>9} {'req/s':>9}")
+    for name, r in results.items():
+        print(
+            f"{name:<12} {r['count']:>8} {r['errors']:>7} "
+            f"{r['p50_ms']:>9.2f} {r['p99_ms']:>9.2f} {r['rps']:>9.1f}"
+        )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load-test the Sionna RT API")
+    parser.add_argument(
+        "--url", default="http://127.0.0.1:8000", help="Base URL of the API"
+    )
+    parser.add_argument(
+        "--start-server",
+        action="store_true",
+        help="Serve the API in-process (fake engine unless SIMULATION_ENGINE is set)",
+    )
+    parser.add_argument("-c", "--concurrency", type=int, default=8)
+    parser.add_argument(
+        "-n", "--requests", type=int, default=1000, help="Total requests"
+    )
+    parser.add_argument(
+        "-d", "--duration", type=float, help="Run for this many seconds instead"
+    )
+    parser.add_argument("--num-tx", type=int, default=1)
+    parser.add_argument("--num-rx", type=int, default=4)
+    parser.add_argument(
+        "--routes",
+        nargs="+",
+        choices=sorted(ROUTES),
+        default=list(ROUTES),
+        help="Routes to cycle through",
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument(
+        "--max-p99-ms",
+        type=float,
+        help="Exit with status 1 if the overall p99 latency exceeds this",
+    )
+    parser.add_argument(
+        "--max-errors",
+        type=int,
+        default=0,
+        help="Exit with status 1 if more measured requests than this fail",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    server = None
+    if args.start_server:
+        parsed = urlparse(args.url)
+        server, thread = start_server(parsed.hostname, parsed.port or 80)
+
+    try:
+        test = LoadTest(args.url, args.num_tx, args.num_rx)
+        test.setup()
+        elapsed = test.run(
+            args.routes,
+            args.concurrency,
+            None if args.duration else args.requests,
+            args.duration,
+        )
+        results = test.report(elapsed)
+    finally:
+        if server is not None:
+            server.should_exit = True
+            thread.join()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_report(results)
+
+    status = 0
+    if results["total"]["errors"] > args.max_errors:
+        print(f"{results['total']['errors']} failed requests (max {args.max_errors})")
+        status = 1
+    if args.max_p99_ms is not None and results["total"]["p99_ms"] > args.max_p99_ms:
+        print(f"p99 latency exceeds {args.max_p99_ms} ms")
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
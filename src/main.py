@@ -1,9 +1,48 @@
+import os
 from typing import Dict, List, Optional, Tuple
 
-from sionna_wrapper import Sionna
-from utils import AntennaType
+import numpy as np
 
-engine = Sionna()
+from simulation_engine import SimulationEngine
+from utils import (
+    AntennaType,
+    PolarizationType,
+    RadiationPattern,
+    SingleFlight,
+    compute_link_statistics,
+)
+
+
+def create_engine(name: str = "sionna") -> SimulationEngine:
+    """
+    Create a simulation engine by name.
+
+    Args:
+        name: 'sionna' for ray tracing or 'fake' for the synthetic engine,
+            whose shape is read from FAKE_NUM_PATHS, FAKE_NUM_TIME_STEPS and
+            FAKE_COMPUTE_DELAY (seconds per path computation)
+    """
+    # Engines are imported lazily so the fake engine runs without sionna installed
+    if name == "sionna":
+        from sionna_wrapper import Sionna
+
+        return Sionna()
+    if name == "fake":
+        from fake_engine import FakeEngine
+
+        return FakeEngine(
+            num_paths=int(os.environ.get("FAKE_NUM_PATHS", 16)),
+            num_time_steps=int(os.environ.get("FAKE_NUM_TIME_STEPS", 1)),
+            compute_delay=float(os.environ.get("FAKE_COMPUTE_DELAY", 0.0)),
+        )
+    raise ValueError(f"Invalid engine: {name}. Must be 'sionna' or 'fake'")
+
+
+engine_name = os.environ.get("SIMULATION_ENGINE", "sionna")
+engine = create_engine(engine_name)
+
+# Deduplicates identical concurrent requests against the same engine state
+single_flight = SingleFlight()
 
 
 def initialize(scene_path: Optional[str] = None) -> None:
@@ -43,7 +82,7 @@ def update_transmitter_position(
     name: str, position: Tuple[float, float, float]
 ) -> Dict:
     """Update the position of an existing transmitter."""
-    engine.update_ant_position(AntennaType.Receiver, name, position)
+    engine.update_ant_position(AntennaType.Transmitter, name, position)
     return {"name": name, "position": position}
 
 
@@ -67,7 +106,7 @@ def add_receiver(
 
 def update_receiver_position(name: str, position: Tuple[float, float, float]) -> Dict:
     """Update the position of an existing receiver."""
-    engine.update_ant_position(AntennaType.Transmitter, name, position)
+    engine.update_ant_position(AntennaType.Receiver, name, position)
     return {"name": name, "position": position}
 
 
@@ -131,6 +170,8 @@ def set_array(
         polarization,
     )
 
+    num_tx_ant, num_rx_ant = engine.get_num_antennas()
+
     return {
         "antenna_type": ant_type,
         "num_rows": num_rows,
@@ -139,14 +180,82 @@ def set_array(
         "horizontal_spacing": horizontal_spacing,
         "pattern": pattern,
         "polarization": polarization,
+        "num_tx_ant": num_tx_ant,
+        "num_rx_ant": num_rx_ant,
     }
 
 
-def compute_paths(max_depth: int = 3) -> Dict:
+def compute_paths(max_depth: int = 3, synthetic_array: bool = True) -> Dict:
     """Compute propagation paths between transmitters and receivers."""
-    return engine.compute_paths(max_depth)
+    key = ("paths", engine.state_version, max_depth, synthetic_array)
+    return single_flight.do(
+        key, lambda: engine.compute_paths(max_depth, synthetic_array)
+    )
 
 
 def get_cir() -> Dict:
     """Get the Channel Impulse Response."""
-    return engine.get_channel_impulse_response()
+    key = ("cir", engine.state_version)
+    return single_flight.do(key, engine.get_channel_impulse_response)
+
+
+def get_cir_arrays() -> Tuple[np.ndarray, np.ndarray]:
+    """Get the raw CIR arrays (a, tau) without serialization."""
+    return engine.get_cir_arrays()
+
+
+def get_channel_statistics(tx_power_dbm: float = 0.0) -> Dict:
+    """
+    Compute per-link channel statistics from the current paths.
+
+    Returns:
+        Dictionary with the transmit power and one entry per (tx, rx) link.
+        Statistics of links without any valid path are None. The K-factor is
+        also None for links with a single path, where it is unbounded; those
+        links are identified by num_paths == 1.
+    """
+    key = ("stats", engine.state_version, tx_power_dbm)
+    return single_flight.do(key, lambda: _compute_channel_statistics(tx_power_dbm))
+
+
+def _compute_channel_statistics(tx_power_dbm: float) -> Dict:
+    a, tau = engine.get_cir_arrays()
+    rx_names, tx_names = engine.get_link_names()
+    if a.shape[0] != len(rx_names) or a.shape[2] != len(tx_names):
+        raise RuntimeError("Paths are stale; recompute paths")
+    phi_t, phi_r = engine.get_path_angles()
+    stats = compute_link_statistics(
+        a, tau, engine.get_los_mask(), tx_power_dbm, phi_t, phi_r
+    )
+
+    links = []
+    for i, rx in enumerate(rx_names):
+        for j, tx in enumerate(tx_names):
+            has_paths = bool(stats["has_paths"][i, j])
+
+            def value(key: str) -> Optional[float]:
+                v = float(stats[key][i, j])
+                return v if has_paths and np.isfinite(v) else None
+
+            links.append(
+                {
+                    "tx": tx,
+                    "rx": rx,
+                    "num_paths": int(stats["num_paths"][i, j]),
+                    "los": bool(stats["los"][i, j]),
+                    "path_gain_db": value("path_gain_db"),
+                    "rss_dbm": value("rss_dbm"),
+                    "rms_delay_spread": value("rms_delay_spread"),
+                    "k_factor_db": value("k_factor_db"),
+                    "strongest_path_delay": value("strongest_path_delay"),
+                    "azimuth_spread_departure": value("azimuth_spread_departure"),
+                    "azimuth_spread_arrival": value("azimuth_spread_arrival"),
+                }
+            )
+
+    return {"tx_power_dbm": tx_power_dbm, "links": links}
+
+
+def get_coalescing_stats() -> Dict:
+    """Get counters of executed and coalesced simulation requests."""
+    return single_flight.stats()
@@ -37,12 +37,10 @@ class PathComputationRequest(BaseModel):
     max_depth: int = Field(
         3, ge=1, le=10, description="Maximum number of reflections/diffractions"
     )
-
-
-class PathComputationResponse(BaseModel):
-    path_count: int
-    max_depth: int
-    message: str = "Paths computed successfully"
+    synthetic_array: bool = Field(
+        True,
+        description="Trace from array centers and synthesize per-element phases",
+    )
 
 
 class CirGains(BaseModel):
@@ -65,6 +63,20 @@ class CirShape(BaseModel):
     num_time_steps: int = Field(description="Number of time steps")
 
 
+class PathComputationResponse(BaseModel):
+    path_count: int
+    max_depth: int
+    synthetic_array: bool
+    computation_time: float = Field(description="Solver wall time (seconds)")
+    synthetic_speedup: Optional[float] = Field(
+        None,
+        description="Measured per-element over synthetic-array solver time for the "
+        "current setup (None until both modes have been computed)",
+    )
+    cir_shape: CirShape = Field(description="Dimensions of the resulting CIR arrays")
+    message: str = "Paths computed successfully"
+
+
 class CirResponse(BaseModel):
     delays: List = Field(
         default_factory=list,
@@ -75,6 +87,52 @@ class CirResponse(BaseModel):
     message: str = "CIR retrieved successfully"
 
 
+class LinkStatistics(BaseModel):
+    """
+    Channel statistics of a single tx-rx link
+
+    All optional fields are None if the link has no paths. k_factor_db is
+    also None for a single-path link (num_paths == 1), where it is unbounded.
+    """
+
+    tx: str
+    rx: str
+    num_paths: int = Field(description="Number of valid propagation paths")
+    los: bool = Field(description="Whether a line-of-sight path exists")
+    path_gain_db: Optional[float] = Field(description="Total path gain (dB)")
+    rss_dbm: Optional[float] = Field(description="Received signal strength (dBm)")
+    rms_delay_spread: Optional[float] = Field(
+        description="Power-weighted RMS delay spread (seconds)"
+    )
+    k_factor_db: Optional[float] = Field(
+        description="Rician K-factor, strongest path over remaining paths (dB); "
+        "None for single-path links"
+    )
+    strongest_path_delay: Optional[float] = Field(
+        description="Delay of the strongest path (seconds)"
+    )
+    azimuth_spread_departure: Optional[float] = Field(
+        description="Power-weighted circular azimuth spread of departure (degrees)"
+    )
+    azimuth_spread_arrival: Optional[float] = Field(
+        description="Power-weighted circular azimuth spread of arrival (degrees)"
+    )
+
+
+class ChannelStatisticsResponse(BaseModel):
+    tx_power_dbm: float
+    links: List[LinkStatistics]
+    message: str = "Channel statistics computed successfully"
+
+
+class CoalescingStatsResponse(BaseModel):
+    """Counters of identical concurrent simulation requests"""
+
+    executed: int = Field(description="Computations actually run")
+    coalesced: int = Field(description="Requests served by an in-flight computation")
+    in_flight: int = Field(description="Computations currently running")
+
+
 class SceneInfoResponse(BaseModel):
     object_count: int
     objects: List[str]
@@ -90,8 +148,7 @@ class StatusResponse(BaseModel):
     status: str
 
 
-class AntennaArrayConfig(BaseModel):
-    antenna_type: str = Field(..., description="Type of antenna: 'tx' or 'rx'")
+class AntennaArrayUpdate(BaseModel):
     num_rows: int = Field(1, ge=1, description="Number of antenna rows")
     num_cols: int = Field(1, ge=1, description="Number of antenna columns")
     vertical_spacing: float = Field(
@@ -108,6 +165,10 @@ class AntennaArrayConfig(BaseModel):
     )
 
 
+class AntennaArrayConfig(AntennaArrayUpdate):
+    antenna_type: str = Field(..., description="Type of antenna: 'tx' or 'rx'")
+
+
 class AntennaArrayResponse(BaseModel):
     antenna_type: str
     num_rows: int
@@ -116,4 +177,36 @@ class AntennaArrayResponse(BaseModel):
     horizontal_spacing: float
     pattern: str
     polarization: str
+    num_tx_ant: int = Field(description="Antennas per transmitter")
+    num_rx_ant: int = Field(description="Antennas per receiver")
     message: str = "Antenna array configured successfully"
+
+
+class TrajectoryConfig(BaseModel):
+    """Per-step positions of a device in a batch scenario"""
+
+    waypoints: List[Position] = Field(
+        default_factory=list,
+        description="Explicit position for each step (last one is held once exhausted)",
+    )
+    velocity: Optional[Position] = Field(
+        None, description="Displacement per step from the device's initial position"
+    )
+
+
+class ScenarioConfig(BaseModel):
+    """Declarative scenario consumed by the headless batch runner"""
+
+    scene: Optional[str] = Field(
+        None, description="Path to the scene file (defaults to the munich scene)"
+    )
+    arrays: List[AntennaArrayConfig] = Field(default_factory=list)
+    transmitters: List[DeviceCreate] = Field(default_factory=list)
+    receivers: List[DeviceCreate] = Field(default_factory=list)
+    trajectories: Dict[str, TrajectoryConfig] = Field(
+        default_factory=dict, description="Trajectories keyed by device name"
+    )
+    num_steps: Optional[int] = Field(
+        None, ge=1, description="Number of steps (defaults to the longest waypoint list)"
+    )
+    solver: PathComputationRequest = Field(default_factory=PathComputationRequest)
@@ -0,0 +1,163 @@
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from utils import AntennaType
+
+
+class SimulationEngine(ABC):
+    """
+    Interface of the simulation engines driven by main.py.
+
+    Implementations: Sionna (sionna_wrapper.py, ray tracing) and FakeEngine
+    (fake_engine.py, synthetic CIRs without sionna, mitsuba or a GPU).
+    """
+
+    def __init__(self):
+        self.scene = None
+        self.transmitters: Dict = {}
+        self.receivers: Dict = {}
+        # Incremented on every change that can affect paths or CIR results
+        self.state_version = 0
+        self._state_lock = threading.Lock()
+        # Latest solver time per (configuration, synthetic_array)
+        self._solver_times: Dict[Tuple, float] = {}
+
+    @abstractmethod
+    def load_simulation_scene(self, scene_path: Optional[str] = None) -> None:
+        """Load a scene, or the default scene if no path is given."""
+
+    @abstractmethod
+    def get_scene_info(self) -> Dict:
+        """Return object and device counts of the loaded scene."""
+
+    @abstractmethod
+    def add_transmitter(
+        self,
+        name: str,
+        position: Tuple[float, float, float],
+        orientation: Optional[Tuple[float, float, float]] = None,
+    ) -> None:
+        """Add a transmitter to the scene."""
+
+    @abstractmethod
+    def add_receiver(
+        self,
+        name: str,
+        position: Tuple[float, float, float],
+        orientation: Optional[Tuple[float, float, float]] = None,
+    ) -> None:
+        """Add a receiver to the scene."""
+
+    @abstractmethod
+    def set_array(
+        self,
+        ant_type: AntennaType,
+        num_rows: int = 1,
+        num_cols: int = 1,
+        vertical_spacing: float = 1.0,
+        horizontal_spacing: float = 1.0,
+        pattern: str = "tr38901",
+        polarization: str = "V",
+    ) -> None:
+        """Set the antenna array used by all transmitters or receivers."""
+
+    @abstractmethod
+    def get_num_antennas(self) -> Tuple[int, int]:
+        """Return the number of antennas per (transmitter, receiver)."""
+
+    @abstractmethod
+    def update_ant_position(
+        self, ant_type: AntennaType, name: str, position: Tuple[float, float, float]
+    ) -> None:
+        """Update the position of an existing transmitter or receiver."""
+
+    @abstractmethod
+    def compute_paths(self, max_depth: int = 3, synthetic_array: bool = True) -> Dict:
+        """Compute propagation paths between transmitters and receivers."""
+
+    @abstractmethod
+    def get_cir_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the raw CIR arrays (a, tau) from computed paths."""
+
+    @abstractmethod
+    def get_link_names(self) -> Tuple[List[str], List[str]]:
+        """Return the (receiver, transmitter) names in the order of the computed CIR axes."""
+
+    @abstractmethod
+    def get_path_angles(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return azimuth angles of departure and arrival (phi_t, phi_r), in radians, shaped like tau."""
+
+    @abstractmethod
+    def get_los_mask(self) -> np.ndarray:
+        """Return whether a valid line-of-sight path exists per link [num_rx, num_tx]."""
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Reset the simulation state."""
+
+    def _bump_state(self) -> None:
+        """Mark a state change; called from concurrent API worker threads."""
+        with self._state_lock:
+            self.state_version += 1
+
+    def _record_solver_time(
+        self, max_depth: int, synthetic_array: bool, computation_time: float
+    ) -> Optional[float]:
+        """
+        Record a solver time and return the measured synthetic-array speed-up.
+
+        The speed-up is the per-element solver time divided by the synthetic
+        solver time, both measured with the same arrays, device counts and
+        max_depth. It is None until both modes have been run for that setup.
+        """
+        config = (
+            self.get_num_antennas(),
+            len(self.transmitters),
+            len(self.receivers),
+            max_depth,
+        )
+        self._solver_times[(config, synthetic_array)] = computation_time
+
+        per_element = self._solver_times.get((config, False))
+        synthetic = self._solver_times.get((config, True))
+        if per_element is None or not synthetic:
+            return None
+        return per_element / synthetic
+
+    def get_channel_impulse_response(self) -> Dict:
+        """Return Channel Impulse Response (CIR) from computed paths."""
+
+        try:
+            a, tau = self.get_cir_arrays()
+
+            # Convert to nested lists for JSON serialization
+            delays = tau.tolist()
+
+            # Handle complex gains - separate real and imaginary parts
+            gains = {
+                "real": a.real.tolist(),
+                "imag": a.imag.tolist(),
+                "magnitude": np.abs(a).tolist(),
+                "phase": np.angle(a).tolist(),
+            }
+
+            # Also provide shape information for easier parsing
+            return {
+                "delays": delays,
+                "gains": gains,
+                "shape": {
+                    "num_rx": int(a.shape[0]),
+                    "num_rx_ant": int(a.shape[1]),
+                    "num_tx": int(a.shape[2]),
+                    "num_tx_ant": int(a.shape[3]),
+                    "num_paths": int(a.shape[4]),
+                    "num_time_steps": int(a.shape[5]),
+                },
+            }
+        except Exception as e:
+            import traceback
+
+            raise RuntimeError(f"Failed to extract CIR: {e}\n{traceback.format_exc()}")
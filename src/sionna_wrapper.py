@@ -1,5 +1,7 @@
-from typing import Dict, Optional, Tuple
+import time
+from typing import Dict, List, Optional, Tuple
 
+from simulation_engine import SimulationEngine
 from utils import AntennaType
 
 try:
@@ -30,13 +32,15 @@ from sionna.rt import (
 )
 
 
-class Sionna:
+class Sionna(SimulationEngine):
     def __init__(self):
-        self.scene = None
+        super().__init__()
         self.transmitters: Dict[str, sionna.rt.Transmitter] = {}
         self.receivers: Dict[str, sionna.rt.Receiver] = {}
         self._path_solver = None
         self._computed_paths = None
+        # Device names in the order of the computed paths' rx/tx axes
+        self._path_link_names: Optional[Tuple[List[str], List[str]]] = None
 
     def load_simulation_scene(self, scene_path: Optional[str] = None):
         try:
@@ -44,6 +48,7 @@ class Sionna:
                 self.scene = load_scene(sionna.rt.scene.munich)
             else:
                 self.scene = load_scene(scene_path)
+            self._bump_state()
 
             print(f"Successfully loaded scene: {scene_path}")
         except Exception as e:
@@ -78,6 +83,7 @@ class Sionna:
 
         self.scene.add(tx)
         self.transmitters[name] = tx
+        self._bump_state()
 
     def add_receiver(
         self,
@@ -99,6 +105,7 @@ class Sionna:
 
         self.scene.add(rx)
         self.receivers[name] = rx
+        self._bump_state()
 
     def set_array(
         self,
@@ -132,6 +139,15 @@ class Sionna:
                 pattern=pattern,
                 polarization=polarization,
             )
+        self._bump_state()
+
+    def get_num_antennas(self) -> Tuple[int, int]:
+        if not self.scene:
+            raise RuntimeError("Scene not loaded")
+
+        num_tx_ant = self.scene.tx_array.num_ant if self.scene.tx_array else 1
+        num_rx_ant = self.scene.rx_array.num_ant if self.scene.rx_array else 1
+        return int(num_tx_ant), int(num_rx_ant)
 
     def update_ant_position(
         self, ant_type: AntennaType, name: str, position: Tuple[float, float, float]
@@ -150,20 +166,38 @@ class Sionna:
             self.receivers[name].position = position
         else:
             raise RuntimeError("Invalid Antenna Type")
+        self._bump_state()
+
+    def compute_paths(self, max_depth: int = 3, synthetic_array: bool = True) -> Dict:
+        """
+        Compute propagation paths between transmitters and receivers.
 
-    def compute_paths(self, max_depth: int = 3) -> Dict:
-        """Compute propagation paths between transmitters and receivers."""
+        With synthetic_array, paths are traced once from each array center and
+        the per-element responses are synthesized from phase shifts, instead of
+        tracing every antenna element separately.
+        """
         if not self.scene:
             raise RuntimeError("Scene not loaded")
 
         if not self.transmitters or not self.receivers:
             raise RuntimeError("No transmitters or receivers in scene")
 
-        # Initialize path solver
-        self._path_solver = sionna.rt.PathSolver()
+        # The solver holds no scene state, so it is reused across calls
+        if self._path_solver is None:
+            self._path_solver = sionna.rt.PathSolver()
 
         # Compute paths
-        self._computed_paths = self._path_solver(scene=self.scene, max_depth=max_depth)
+        start = time.perf_counter()
+        self._computed_paths = self._path_solver(
+            scene=self.scene, max_depth=max_depth, synthetic_array=synthetic_array
+        )
+        # Taken from the scene itself, which is what the solver traced
+        self._path_link_names = (
+            list(self.scene.receivers.keys()),
+            list(self.scene.transmitters.keys()),
+        )
+        computation_time = time.perf_counter() - start
+        self._bump_state()
 
         path_count = 0
         if (
@@ -173,53 +207,69 @@ class Sionna:
             # vertices shape is typically [batch, num_rx, num_tx, max_paths, max_depth, 3]
             path_count = int(np.prod(self._computed_paths.vertices.shape[:4]))
 
+        # a is a (real, imag) pair shaped [num_rx, num_rx_ant, num_tx, num_tx_ant, num_paths];
+        # cir() adds a single time step by default
+        a_shape = self._computed_paths.a[0].shape
+
         return {
             "path_count": path_count,
             "max_depth": max_depth,
+            "synthetic_array": synthetic_array,
+            "computation_time": computation_time,
+            "synthetic_speedup": self._record_solver_time(
+                max_depth, synthetic_array, computation_time
+            ),
+            "cir_shape": {
+                "num_rx": int(a_shape[0]),
+                "num_rx_ant": int(a_shape[1]),
+                "num_tx": int(a_shape[2]),
+                "num_tx_ant": int(a_shape[3]),
+                "num_paths": int(a_shape[4]),
+                "num_time_steps": 1,
+            },
         }
 
-    def get_channel_impulse_response(self) -> Dict:
-        """Return Channel Impulse Response (CIR) from computed paths."""
-
-        try:
-            # Use the Paths.cir() method to get channel impulse response
-            # Returns (a, tau) where:
-            # a: complex path coefficients [num_rx, num_rx_ant, num_tx, num_tx_ant, num_paths, num_time_steps]
-            # tau: path delays [num_rx, num_rx_ant, num_tx, num_tx_ant, num_paths]
-
-            a, tau = self._computed_paths.cir(
-                normalize_delays=True,  # Normalize first path to zero delay
-                out_type="numpy",  # Get numpy arrays
-            )
-
-            # Convert to nested lists for JSON serialization
-            delays = tau.tolist()
-
-            # Handle complex gains - separate real and imaginary parts
-            gains = {
-                "real": a.real.tolist(),
-                "imag": a.imag.tolist(),
-                "magnitude": np.abs(a).tolist(),
-                "phase": np.angle(a).tolist(),
-            }
-
-            # Also provide shape information for easier parsing
-            return {
-                "delays": delays,
-                "gains": gains,
-                "shape": {
-                    "num_rx": int(a.shape[0]),
-                    "num_rx_ant": int(a.shape[1]),
-                    "num_tx": int(a.shape[2]),
-                    "num_tx_ant": int(a.shape[3]),
-                    "num_paths": int(a.shape[4]),
-                    "num_time_steps": int(a.shape[5]),
-                },
-            }
-        except Exception as e:
-            import traceback
-
-            raise RuntimeError(f"Failed to extract CIR: {e}\n{traceback.format_exc()}")
+    def get_cir_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._computed_paths is None:
+            raise RuntimeError("No paths computed")
+
+        # Use the Paths.cir() method to get channel impulse response
+        # Returns (a, tau) where:
+        # a: complex path coefficients [num_rx, num_rx_ant, num_tx, num_tx_ant, num_paths, num_time_steps]
+        # tau: path delays [num_rx, num_rx_ant, num_tx, num_tx_ant, num_paths]
+        return self._computed_paths.cir(
+            normalize_delays=True,  # Normalize first path to zero delay
+            out_type="numpy",  # Get numpy arrays
+        )
+
+    def get_link_names(self) -> Tuple[List[str], List[str]]:
+        if self._path_link_names is None:
+            raise RuntimeError("No paths computed")
+        return self._path_link_names
+
+    def get_path_angles(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._computed_paths is None:
+            raise RuntimeError("No paths computed")
+
+        return (
+            self._computed_paths.phi_t.numpy(),
+            self._computed_paths.phi_r.numpy(),
+        )
+
+    def get_los_mask(self) -> np.ndarray:
+        if self._computed_paths is None:
+            raise RuntimeError("No paths computed")
+
+        # interactions: [max_depth, num_rx, (num_rx_ant), num_tx, (num_tx_ant), num_paths]
+        # A LOS path has no interaction at any depth
+        interactions = self._computed_paths.interactions.numpy()
+        valid = self._computed_paths.valid.numpy()
+        los = valid & np.all(
+            interactions == sionna.rt.constants.InteractionType.NONE, axis=0
+        )
+        if los.ndim == 5:
+            los = los.any(axis=(1, 3))
+        return los.any(axis=-1)
 
     def reset(self) -> None:
         """Reset the simulation state."""
@@ -227,3 +277,5 @@ class Sionna:
         self.receivers.clear()
         self._path_solver = None
         self._computed_paths = None
+        self._path_link_names = None
+        self._bump_state()
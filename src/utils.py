@@ -1,4 +1,8 @@
+import threading
 from enum import Enum
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import numpy as np
 
 
 class AntennaType(Enum):
@@ -25,3 +29,145 @@ class PolarizationType(Enum):
     VERTICAL = "V"
     HORIZONTAL = "H"
     CROSS = "cross"
+
+
+def compute_link_statistics(
+    a: np.ndarray,
+    tau: np.ndarray,
+    los: Optional[np.ndarray] = None,
+    tx_power_dbm: float = 0.0,
+    phi_t: Optional[np.ndarray] = None,
+    phi_r: Optional[np.ndarray] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Reduce CIR arrays to per-link channel statistics.
+
+    Path powers are averaged over antenna pairs and time steps; delays and
+    angles are taken from the first antenna pair. Paths with zero power or
+    negative delay are treated as invalid. Angular spreads use the
+    power-weighted circular definition sqrt(-2 ln |sum(p exp(j phi))| / sum(p)),
+    which does not depend on where the azimuth wraps around.
+
+    Args:
+        a: Complex path coefficients [num_rx, num_rx_ant, num_tx, num_tx_ant, num_paths, num_time_steps]
+        tau: Path delays [num_rx, num_rx_ant, num_tx, num_tx_ant, num_paths] or [num_rx, num_tx, num_paths]
+        los: Optional LOS presence per link [num_rx, num_tx]
+        tx_power_dbm: Transmit power used for the received signal strength
+        phi_t: Optional azimuth angles of departure (radians), shaped like tau
+        phi_r: Optional azimuth angles of arrival (radians), shaped like tau
+
+    Returns:
+        Dictionary of [num_rx, num_tx] arrays. 'has_paths' flags links with at
+        least one valid path; the other entries are meaningless where it is False.
+        The K-factor is +inf for links with a single valid path, and the angular
+        spreads are NaN when the angles are not given.
+    """
+    power = np.mean(np.abs(a) ** 2, axis=(1, 3, 5))
+    if tau.ndim == 5:
+        tau = tau[:, 0, :, 0]
+
+    valid = (power > 0) & (tau >= 0)
+    power = np.where(valid, power, 0.0)
+    tau = np.where(valid, tau, 0.0)
+
+    total = power.sum(axis=-1)
+    has_paths = total > 0
+    safe_total = np.where(has_paths, total, 1.0)
+
+    mean_delay = (power * tau).sum(axis=-1) / safe_total
+    mean_sq_delay = (power * tau**2).sum(axis=-1) / safe_total
+    rms_delay_spread = np.sqrt(np.maximum(mean_sq_delay - mean_delay**2, 0.0))
+
+    strongest = np.argmax(power, axis=-1)[..., None]
+    strongest_power = np.take_along_axis(power, strongest, axis=-1)[..., 0]
+    strongest_delay = np.take_along_axis(tau, strongest, axis=-1)[..., 0]
+    scattered_power = total - strongest_power
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        path_gain_db = 10 * np.log10(safe_total)
+        # Rician K-factor: strongest path over the sum of all remaining paths
+        k_factor_db = 10 * np.log10(
+            strongest_power / np.where(scattered_power > 0, scattered_power, 0.0)
+        )
+
+    def angular_spread(phi: Optional[np.ndarray]) -> np.ndarray:
+        if phi is None:
+            return np.full(has_paths.shape, np.nan)
+        if phi.ndim == 5:
+            phi = phi[:, 0, :, 0]
+        resultant = np.abs((power * np.exp(1j * phi)).sum(axis=-1)) / safe_total
+        return np.degrees(np.sqrt(-2 * np.log(np.clip(resultant, 1e-12, 1.0))))
+
+    if los is None:
+        los = np.zeros(has_paths.shape, dtype=bool)
+
+    return {
+        "has_paths": has_paths,
+        "num_paths": valid.sum(axis=-1),
+        "path_gain_db": path_gain_db,
+        "rss_dbm": tx_power_dbm + path_gain_db,
+        "rms_delay_spread": rms_delay_spread,
+        "k_factor_db": k_factor_db,
+        "los": los & has_paths,
+        "strongest_path_delay": strongest_delay,
+        "azimuth_spread_departure": angular_spread(phi_t),
+        "azimuth_spread_arrival": angular_spread(phi_r),
+    }
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls.
+
+    The first caller for a key runs the function; callers arriving with the
+    same key while it is in flight wait and receive its result (or exception)
+    instead of running it again.
+    """
+
+    class _Call:
+        def __init__(self):
+            self.done = threading.Event()
+            self.result: Any = None
+            self.error: Optional[BaseException] = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, "SingleFlight._Call"] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run fn for key, or wait for the identical call already in flight."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = SingleFlight._Call()
+                self.executed += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "executed": self.executed,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls),
+            }
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# Modules in src/ import each other by name, as when running from that directory
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+# main.py creates its engine at import time; the fake engine needs no sionna
+os.environ.setdefault("SIMULATION_ENGINE", "fake")
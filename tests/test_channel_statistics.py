@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+import main
+from fake_engine import FakeEngine
+from utils import compute_link_statistics
+
+
+def make_cir(gains, delays):
+    """Single-antenna CIR arrays for links given as [num_rx][num_tx][num_paths]."""
+    gains = np.asarray(gains, dtype=np.complex64)
+    a = gains[:, None, :, None, :, None]
+    tau = np.asarray(delays, dtype=np.float32)[:, None, :, None, :]
+    return a, tau
+
+
+def test_two_path_link():
+    a, tau = make_cir([[[1.0, np.sqrt(0.5)]]], [[[0.0, 1e-7]]])
+    stats = compute_link_statistics(a, tau, tx_power_dbm=30.0)
+
+    assert stats["has_paths"][0, 0]
+    assert stats["num_paths"][0, 0] == 2
+    assert stats["path_gain_db"][0, 0] == pytest.approx(10 * np.log10(1.5))
+    assert stats["rss_dbm"][0, 0] == pytest.approx(30 + 10 * np.log10(1.5))
+    assert stats["k_factor_db"][0, 0] == pytest.approx(3.0103, abs=1e-4)
+    assert stats["strongest_path_delay"][0, 0] == 0.0
+    # Powers 1 and 0.5 at 0 and 100 ns: mean 33.3 ns, RMS spread 47.1 ns
+    assert stats["rms_delay_spread"][0, 0] == pytest.approx(np.sqrt(2) / 3 * 1e-7)
+
+
+def test_invalid_paths_are_excluded():
+    a, tau = make_cir([[[1.0, 0.5, 0.0]]], [[[0.0, -1.0, 2e-7]]])
+    stats = compute_link_statistics(a, tau)
+
+    assert stats["num_paths"][0, 0] == 1
+    assert stats["path_gain_db"][0, 0] == pytest.approx(0.0)
+    assert stats["rms_delay_spread"][0, 0] == 0.0
+
+
+def test_single_path_k_factor_is_unbounded():
+    a, tau = make_cir([[[1.0]]], [[[0.0]]])
+    stats = compute_link_statistics(a, tau)
+
+    assert stats["k_factor_db"][0, 0] == np.inf
+
+
+def test_link_without_paths():
+    a, tau = make_cir([[[1.0], [0.0]]], [[[0.0], [-1.0]]])
+    los = np.array([[True, True]])
+    stats = compute_link_statistics(a, tau, los)
+
+    assert stats["has_paths"].tolist() == [[True, False]]
+    assert stats["los"].tolist() == [[True, False]]
+
+
+def test_angular_spread():
+    a, tau = make_cir([[[1.0, 1.0]]], [[[0.0, 1e-8]]])
+    theta = np.radians(30.0)
+    phi = np.array([[[-theta, theta]]])
+    stats = compute_link_statistics(a, tau, phi_t=phi, phi_r=np.zeros_like(phi))
+
+    # Two equal paths at +-theta: |mean resultant| = cos(theta)
+    expected = np.degrees(np.sqrt(-2 * np.log(np.cos(theta))))
+    assert stats["azimuth_spread_departure"][0, 0] == pytest.approx(expected)
+    assert stats["azimuth_spread_arrival"][0, 0] == pytest.approx(0.0, abs=1e-3)
+
+
+def test_angular_spread_wraps_around():
+    a, tau = make_cir([[[1.0, 1.0]]], [[[0.0, 1e-8]]])
+    near_pi = np.array([[[np.pi - 0.1, -np.pi + 0.1]]])
+    near_zero = np.array([[[-0.1, 0.1]]])
+    stats = compute_link_statistics(a, tau, phi_t=near_pi, phi_r=near_zero)
+
+    assert stats["azimuth_spread_departure"][0, 0] == pytest.approx(
+        stats["azimuth_spread_arrival"][0, 0]
+    )
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    engine = FakeEngine(num_paths=4)
+    monkeypatch.setattr(main, "engine", engine)
+    main.initialize()
+    main.add_transmitter("tx0", (0.0, 0.0, 30.0))
+    main.add_receiver("rx0", (100.0, 0.0, 1.5))
+    return engine
+
+
+def test_statistics_use_traced_links(engine):
+    main.compute_paths()
+    main.add_receiver("rx1", (200.0, 0.0, 1.5))
+
+    links = main.get_channel_statistics(30.0)["links"]
+
+    assert [(link["tx"], link["rx"]) for link in links] == [("tx0", "rx0")]
+    assert links[0]["num_paths"] == 4
+    assert links[0]["los"]
+
+
+def test_statistics_after_reset(engine):
+    main.compute_paths()
+    main.reset_scene()
+
+    with pytest.raises(RuntimeError):
+        main.get_channel_statistics()
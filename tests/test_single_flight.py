@@ -0,0 +1,96 @@
+import threading
+import time
+
+import pytest
+
+import main
+from fake_engine import FakeEngine
+from utils import SingleFlight
+
+
+def run_concurrently(flight, key, fn, num_callers):
+    """Start num_callers calls; fn blocks until every follower is waiting on it."""
+    results, errors = [], []
+    release = threading.Event()
+
+    def blocking_fn():
+        release.wait(timeout=5)
+        return fn()
+
+    def caller():
+        try:
+            results.append(flight.do(key, blocking_fn))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=caller) for _ in range(num_callers)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while flight.stats()["coalesced"] < num_callers - 1:
+        assert time.monotonic() < deadline, "callers did not coalesce"
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def test_concurrent_calls_are_coalesced():
+    flight = SingleFlight()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"value": 42}
+
+    results, errors = run_concurrently(flight, "key", compute, 8)
+
+    assert errors == []
+    assert len(calls) == 1
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
+    assert flight.stats() == {"executed": 1, "coalesced": 7, "in_flight": 0}
+
+
+def test_error_propagates_to_waiting_callers():
+    flight = SingleFlight()
+
+    def fail():
+        raise RuntimeError("solver failed")
+
+    results, errors = run_concurrently(flight, "key", fail, 4)
+
+    assert results == []
+    assert len(errors) == 4
+    assert all(str(e) == "solver failed" for e in errors)
+    assert flight.stats()["in_flight"] == 0
+
+    # A failed call is not cached; the next call runs again
+    assert flight.do("key", lambda: "ok") == "ok"
+
+
+def test_sequential_and_distinct_calls_are_not_coalesced():
+    flight = SingleFlight()
+
+    assert flight.do("a", lambda: 1) == 1
+    assert flight.do("a", lambda: 2) == 2
+    assert flight.do("b", lambda: 3) == 3
+    assert flight.stats() == {"executed": 3, "coalesced": 0, "in_flight": 0}
+
+
+def test_state_change_gives_new_key(monkeypatch):
+    monkeypatch.setattr(main, "engine", FakeEngine())
+    monkeypatch.setattr(main, "single_flight", SingleFlight())
+    main.initialize()
+    main.add_transmitter("tx0", (0.0, 0.0, 30.0))
+    main.add_receiver("rx0", (100.0, 0.0, 1.5))
+    main.compute_paths()
+
+    first = main.get_cir()
+    main.update_receiver_position("rx0", (50.0, 0.0, 1.5))
+    main.compute_paths()
+    second = main.get_cir()
+
+    assert first is not second
+    assert main.get_coalescing_stats()["executed"] == 4